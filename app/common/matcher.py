@@ -23,6 +23,10 @@ class Matcher:
         self.nms_threshold = nms_threshold
         self.max_scale = 1
         self.scales = {}
+        # 锐化卷积核
+        self.kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+        # 预处理后的模板缓存，键为(模板路径, 文件修改时间)
+        self.templates = {}
         self._init_scales()
         self._get_max_scale()
 
@@ -112,19 +116,36 @@ class Matcher:
             step_confidences.append(float(confidence))
         return step_confidences, step_boxes
 
-    def match(self, template_path: str, target: cv2.typing.MatLike):
+    def load_template(self, template_path: str):
+        """
+        读取并预处理模板图片，同一文件未修改时直接使用缓存
+        :param template_path: 模板图片路径
+        :return: (灰度模板, 掩码)
+        """
+        key = (template_path, os.stat(template_path).st_mtime_ns)
+        cached = self.templates.get(key)
+        if cached is not None:
+            return cached
+
         template = cv2.imread(template_path, cv2.IMREAD_UNCHANGED)
         if template.shape[-1] == 4:
             mask = template[:, :, 3]  # 提取alpha通道
         else:
             mask = None
-
         # 预处理：锐化 + 边缘增强
-        kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
-        template = cv2.filter2D(template, -1, kernel)
-        target = cv2.filter2D(target, -1, kernel)
+        template = cv2.filter2D(template, -1, self.kernel)
         # 转换为灰度图
         template = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+
+        self.templates[key] = template, mask
+        return template, mask
+
+    def match(self, template_path: str, target: cv2.typing.MatLike):
+        template, mask = self.load_template(template_path)
+
+        # 预处理：锐化 + 边缘增强
+        target = cv2.filter2D(target, -1, self.kernel)
+        # 转换为灰度图
         target = cv2.cvtColor(target, cv2.COLOR_BGR2GRAY)
         # 获取模板尺寸
         tpl_h, tpl_w = template.shape[:2]
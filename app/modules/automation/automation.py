@@ -70,6 +70,8 @@ class Automation:
         self.scale_y = 1
         self.relative_pos = None
         self.ocr_result = None
+        # 当前截图上的ocr结果缓存，键为(crop, extract)，每次截图后清空
+        self.ocr_cache = {}
 
         self.running = True
         self.pause = False
@@ -90,6 +92,13 @@ class Automation:
         self.press_key = self.input_handler.press_key
         self.key_down = self.input_handler.key_down
         self.key_up = self.input_handler.key_up
+        # 动作到方法的映射，只在初始化时构建一次
+        self.click_action_map = {
+            "mouse_click": self.mouse_click,
+            "down": self.mouse_down,
+            "move": self.move_to,
+            "move_click": self.move_click,
+        }
 
     def type_string(self, text):
         """
@@ -160,6 +169,7 @@ class Automation:
         try:
             result = self.screenshot.screenshot(self.screenshot_hwnd, (0, 0, 1, 1), self.is_starter,
                                                 is_interval=is_interval)
+            self.ocr_cache.clear()
             if result:
                 self.first_screenshot, self.scale_x, self.scale_y, self.relative_pos = result
                 if crop != (0, 0, 1, 1):
@@ -300,6 +310,23 @@ class Automation:
             self.logger.error(f"OCR识别失败：{e}")
             self.ocr_result = []  # 确保在异常情况下，ocr_result为列表类型
 
+    def perform_ocr_cached(self, crop=(0, 0, 1, 1), extract: list = None, image=None, is_log=False):
+        """
+        执行OCR，同一张截图上crop和extract相同时直接复用上次的识别结果
+        :param crop: 被识别图像在first_screenshot中对应的裁切区域
+        :param extract: 同perform_ocr
+        :param image: 同perform_ocr，为None时识别current_screenshot
+        :param is_log:
+        :return:
+        """
+        key = (tuple(crop), str(extract))
+        cached = self.ocr_cache.get(key)
+        if cached is not None:
+            self.ocr_result = cached
+            return
+        self.perform_ocr(extract, image=image, is_log=is_log)
+        self.ocr_cache[key] = self.ocr_result
+
     def calculate_text_position(self, result):
         """
         计算文本所在的相对位置
@@ -350,9 +377,10 @@ class Automation:
         # self.logger.info(f"目标文字：{', '.join(targets)} 未找到匹配文字")
         return None, None
 
-    def find_text_element(self, target, include, need_ocr=True, extract=None, is_log=False):
+    def find_text_element(self, target, include, need_ocr=True, extract=None, is_log=False, crop=(0, 0, 1, 1)):
         """
 
+        :param crop: current_screenshot对应的裁切区域，用于复用同一截图上的ocr结果
         :param is_log:
         :param target:
         :param include:
@@ -362,7 +390,7 @@ class Automation:
         """
         target_texts = [target] if isinstance(target, str) else list(target)  # 确保目标文本是列表格式
         if need_ocr:
-            self.perform_ocr(extract, is_log=is_log)
+            self.perform_ocr_cached(crop, extract, is_log=is_log)
         return self.search_text_in_ocr_results(target_texts, include)
 
     @atoms
@@ -407,7 +435,7 @@ class Automation:
                                                                                   match_method=match_method,
                                                                                   extract=extract, is_log=is_log)
             elif find_type == 'text':
-                top_left, bottom_right = self.find_text_element(target, include, need_ocr, extract, is_log)
+                top_left, bottom_right = self.find_text_element(target, include, need_ocr, extract, is_log, crop)
             if top_left and bottom_right:
                 if find_type == 'image_threshold':
                     return image_threshold
@@ -436,18 +464,11 @@ class Automation:
         click_x = x + offset[0]
         click_y = y + offset[1]
         # print(f"{x=},{y=}")
-        # 动作到方法的映射
-        action_map = {
-            "mouse_click": self.mouse_click,
-            "down": self.mouse_down,
-            "move": self.move_to,
-            "move_click": self.move_click,
-        }
-        if action in action_map:
-            action_map[action](click_x, click_y)
-            # print(f"点击{click_x},{click_y}")
-        else:
+        handler = self.click_action_map.get(action)
+        if handler is None:
             raise ValueError(f"未知的动作类型: {action}")
+        handler(click_x, click_y)
+        # print(f"点击{click_x},{click_y}")
         return True
 
     def click_element(self, target, find_type: str, threshold: float = 0.5, crop: tuple = (0, 0, 1, 1),
@@ -499,7 +520,7 @@ class Automation:
             # 更新self.current_screenshot
             self.take_screenshot(crop)
             # 更新self.ocr_result
-            self.perform_ocr(is_log=is_log)
+            self.perform_ocr_cached(crop, is_log=is_log)
         for result in self.ocr_result:
             text = result[0]
             match, matched_text = self.is_text_match(text, target_texts, include)
@@ -560,7 +581,7 @@ class Automation:
             self.take_screenshot()
         crop_image, _ = ImageUtils.crop_image(self.first_screenshot, crop, self.hwnd)
         # ImageUtils.show_ndarray(crop_image)
-        self.perform_ocr(image=crop_image, extract=extract, is_log=is_log)
+        self.perform_ocr_cached(crop, extract, image=crop_image, is_log=is_log)
         return self.ocr_result
 
     @atoms